@@ -7,24 +7,54 @@ Saves transcripts for analysis by youtube-learning-agent
 import sys
 import os
 from datetime import datetime
-from youtube_transcript_api import YouTubeTranscriptApi
+from urllib.parse import urlparse, parse_qs
+import operator
 import re
-import json
+import orjson
+
+# Compiled once at import so repeated calls skip the regex cache entirely;
+# one alternation covers all the YouTube URL formats we accept
+_VIDEO_ID_RE = re.compile(r'(?:youtube\.com\/(?:watch\?v=|embed\/|v\/)|youtu\.be\/)([\w-]+)')
+
+# Output directories are created once per process instead of stat'ing them
+# on every save_transcript call
+_DIRS_READY = False
+
+def _ensure_dirs():
+    global _DIRS_READY
+    if not _DIRS_READY:
+        os.makedirs('learning/raw-transcripts', exist_ok=True)
+        os.makedirs('learning/youtube-metadata', exist_ok=True)
+        _DIRS_READY = True
 
 def extract_video_id(url):
     """Extract video ID from various YouTube URL formats"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=)([\w-]+)',
-        r'(?:youtu\.be\/)([\w-]+)',
-        r'(?:youtube\.com\/embed\/)([\w-]+)',
-        r'(?:youtube\.com\/v\/)([\w-]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
+    # Fast path: real URLs go through the C-level urlparse instead of the
+    # regex engine; bare IDs skip parsing entirely
+    if url.startswith('http'):
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        if host.endswith('youtu.be'):
+            video_id = parsed.path.lstrip('/').split('/', 1)[0]
+            if video_id:
+                return video_id
+        elif 'youtube.com' in host:
+            if parsed.path == '/watch':
+                v = parse_qs(parsed.query).get('v')
+                if v:
+                    return v[0]
+            else:
+                for prefix in ('/embed/', '/v/'):
+                    if parsed.path.startswith(prefix):
+                        video_id = parsed.path[len(prefix):].split('/', 1)[0]
+                        if video_id:
+                            return video_id
+
+    # Last resort: regex over whatever we were given
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
+
     # If no pattern matches, assume it's already a video ID
     return url
 
@@ -39,39 +69,50 @@ def get_video_info(video_id):
 def save_transcript(video_id, transcript_data, metadata=None):
     """Save transcript to file system for agent processing"""
     
-    # Create directory structure
-    os.makedirs('learning/raw-transcripts', exist_ok=True)
-    os.makedirs('learning/youtube-metadata', exist_ok=True)
-    
-    # Process transcript text (handle snippet objects)
-    if transcript_data and hasattr(transcript_data[0], 'text'):
-        # Handle snippet objects
-        transcript_text = '\n'.join([snippet.text for snippet in transcript_data])
-    else:
-        # Handle dict format
-        transcript_text = '\n'.join([entry['text'] for entry in transcript_data])
+    # Create directory structure (first call only)
+    _ensure_dirs()
     
     # Create filename (sanitize video_id)
     safe_filename = re.sub(r'[^\w\-_]', '_', video_id)
-    
-    # Save raw transcript
+
+    # Stream the transcript to disk snippet-by-snippet instead of joining
+    # everything into one giant string first; the 64KB buffer coalesces the
+    # small writes into large sequential I/O
     transcript_path = f'learning/raw-transcripts/{safe_filename}.txt'
-    with open(transcript_path, 'w', encoding='utf-8') as f:
-        f.write(transcript_text)
+
+    # Detect snippet objects vs dicts once and bind an accessor, so the hot
+    # loops below stay monomorphic instead of re-probing per item
+    is_snippet = bool(transcript_data) and hasattr(transcript_data[0], 'text')
+    get_text = operator.attrgetter('text') if is_snippet else operator.itemgetter('text')
+
+    with open(transcript_path, 'wb', buffering=65536) as f:
+        write = f.write
+        sep = b''
+        for item in transcript_data:
+            write(sep)
+            write(get_text(item).encode('utf-8'))
+            sep = b'\n'
     
     # Save metadata with timestamps
     metadata_path = f'learning/youtube-metadata/{safe_filename}.json'
 
-    # Convert snippets to dict format for JSON serialization
-    if transcript_data and hasattr(transcript_data[0], 'text'):
+    # Convert snippets to dict format for JSON serialization; attrgetter
+    # pulls all three fields per snippet in one C-level call
+    if is_snippet:
+        get_fields = operator.attrgetter('text', 'start', 'duration')
         transcript_dict = [
-            {'text': s.text, 'start': s.start, 'duration': s.duration}
-            for s in transcript_data
+            {'text': text, 'start': start, 'duration': duration}
+            for text, start, duration in map(get_fields, transcript_data)
         ]
-        total_duration = transcript_data[-1].start + transcript_data[-1].duration if transcript_data else 0
+        last = transcript_data[-1]
+        total_duration = last.start + last.duration
+    elif transcript_data:
+        transcript_dict = transcript_data
+        last = transcript_data[-1]
+        total_duration = last['start'] + last['duration']
     else:
         transcript_dict = transcript_data
-        total_duration = transcript_data[-1]['start'] + transcript_data[-1]['duration'] if transcript_data else 0
+        total_duration = 0
 
     full_metadata = {
         'video_info': metadata or get_video_info(video_id),
@@ -79,23 +120,32 @@ def save_transcript(video_id, transcript_data, metadata=None):
         'total_duration': total_duration
     }
 
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(full_metadata, f, indent=2)
+    with open(metadata_path, 'wb') as f:
+        f.write(orjson.dumps(full_metadata))
     
     return transcript_path, metadata_path
 
-def main():
+def main(argv=None):
     """Main function to fetch and save transcript"""
-    
-    if len(sys.argv) < 2:
+
+    # argv lets callers (like the test suite) invoke this in-process
+    # without spawning a fresh interpreter
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) < 1:
         print("Usage: python get_transcript.py <YouTube_URL_or_ID> [language_code]")
         print("Example: python get_transcript.py https://youtube.com/watch?v=abc123")
         print("Example: python get_transcript.py abc123 en")
         sys.exit(1)
-    
-    url_or_id = sys.argv[1]
-    language = sys.argv[2] if len(sys.argv) > 2 else 'en'
-    
+
+    url_or_id = argv[0]
+    language = argv[1] if len(argv) > 1 else 'en'
+
+    # Deferred import: youtube_transcript_api drags in its HTTP stack and
+    # noticeably slows startup, so usage/argument errors never pay for it
+    from youtube_transcript_api import YouTubeTranscriptApi
+
     try:
         # Extract video ID
         video_id = extract_video_id(url_or_id)
@@ -4,15 +4,45 @@ Architecture Scanner - Auto-generates architecture documentation
 Scans the workspace and updates the architecture overview based on current state
 """
 
+import io
 import os
 import json
-import glob
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set
 import re
 
+# Compiled once at import; matched against raw bytes so files never need a
+# full decode just to pull out a name or docstring
+_NAME_RE = re.compile(rb'name:\s*"([^"]+)"')
+_COMMENT_RE = re.compile(rb'#\s*(.+)')
+_DOCSTRING_RE = re.compile(rb'"""(.*?)"""', re.DOTALL)
+
+
+def _list_files(directory, suffix: str) -> List[str]:
+    """List files with the given suffix using one scandir pass (no per-entry stat)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [e.path for e in entries
+                    if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
+def _count_files(directory, suffix: str = '') -> int:
+    """Count directory entries matching a suffix without building Path objects"""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for e in entries if e.name.endswith(suffix))
+    except FileNotFoundError:
+        return 0
+
+
 class ArchitectureScanner:
+    CACHE_FILE = ".architecture_scanner_cache.json"
+
     def __init__(self, base_path: str = "."):
         self.base_path = Path(base_path)
         self.agents = {}
@@ -20,81 +50,174 @@ class ArchitectureScanner:
         self.knowledge_structure = {}
         self.docs = []
         self.tests = []
+        self._cache = None
+        self._cache_dirty = False
+
+    def _load_cache(self) -> Dict:
+        """Load the parse cache keyed by path -> [(mtime_ns, size), parsed]"""
+        if self._cache is None:
+            try:
+                with open(self.base_path / self.CACHE_FILE) as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self):
+        """Persist the parse cache if anything was re-parsed this run"""
+        if self._cache_dirty and self._cache is not None:
+            try:
+                with open(self.base_path / self.CACHE_FILE, 'w') as f:
+                    json.dump(self._cache, f)
+                self._cache_dirty = False
+            except OSError as e:
+                print(f"Warning: could not save scanner cache: {e}")
+
+    def _scan_with_cache(self, files: List[str], parse) -> List:
+        """Return parsed results for files, re-parsing only changed ones
+
+        Unchanged files (same mtime_ns and size) come straight from the
+        cache; the rest go through the thread pool and refresh it.
+        """
+        cache = self._load_cache()
+        results = {}
+        to_parse = []
+        for path in files:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = [st.st_mtime_ns, st.st_size]
+            cached = cache.get(path)
+            if cached and cached[0] == key:
+                results[path] = cached[1]
+            else:
+                to_parse.append((path, key))
+
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                parsed_iter = executor.map(parse, [p for p, _ in to_parse])
+                for (path, key), parsed in zip(to_parse, parsed_iter):
+                    if parsed is not None:
+                        # JSON round-trips tuples as lists, so normalize now
+                        parsed = list(parsed) if isinstance(parsed, tuple) else parsed
+                        results[path] = parsed
+                        cache[path] = [key, parsed]
+                        self._cache_dirty = True
+
+        return [results[p] for p in files if p in results]
 
     def scan_agents(self) -> Dict:
         """Scan all agent YAML files and extract their metadata"""
         agents_dir = self.base_path / "agents"
-        agent_files = glob.glob(str(agents_dir / "*.yml"))
+        agent_files = _list_files(agents_dir, ".yml")
 
-        for agent_file in sorted(agent_files):
-            agent_name = Path(agent_file).stem
-            try:
-                with open(agent_file, 'r') as f:
-                    content = f.read()
-                    # Extract description from first comment or name field
-                    desc_match = re.search(r'name:\s*"([^"]+)"', content)
-                    if not desc_match:
-                        desc_match = re.search(r'#\s*(.+)', content[:200])
-
-                    # Check for tools mentioned
-                    tools = []
-                    if 'web_search' in content:
-                        tools.append('web_search')
-                    if 'web_fetch' in content:
-                        tools.append('web_fetch')
-                    if 'read_file' in content or 'Read' in content:
-                        tools.append('file_operations')
-
-                    # Detect agent type
-                    agent_type = 'support'
-                    if 'coordinator' in agent_name:
-                        agent_type = 'orchestrator'
-                    elif 'fetcher' in agent_name or 'media' in agent_name:
-                        agent_type = 'acquisition'
-                    elif 'analyzer' in agent_name or 'analysis' in agent_name:
-                        agent_type = 'analysis'
-                    elif 'builder' in agent_name or 'knowledge' in agent_name:
-                        agent_type = 'knowledge'
-                    elif 'meta' in agent_name:
-                        agent_type = 'meta'
-
-                    self.agents[agent_name] = {
-                        'description': desc_match.group(1) if desc_match else 'Agent',
-                        'type': agent_type,
-                        'tools': tools,
-                        'file': agent_file,
-                        'lines': len(content.split('\n'))
-                    }
-            except Exception as e:
-                print(f"Error reading {agent_file}: {e}")
+        # File reads release the GIL, so a thread pool overlaps the per-file
+        # I/O; unchanged files are served from the mtime/size-keyed cache
+        for name, info in self._scan_with_cache(agent_files, self._parse_agent):
+            self.agents[name] = info
 
         return self.agents
 
+    @staticmethod
+    def _parse_agent(agent_file):
+        """Parse one agent YAML file into (name, info), or None on error"""
+        agent_name = Path(agent_file).stem
+        try:
+            with open(agent_file, 'rb') as f:
+                # The name:, leading comment, and tool list all live near
+                # the top of the YAML, so an 8KB head read covers almost
+                # every agent file without pulling the rest off disk
+                head = f.read(8192)
+
+                # Extract description from first comment or name field
+                desc_match = _NAME_RE.search(head)
+                if not desc_match:
+                    desc_match = _COMMENT_RE.search(head[:200])
+
+                # Check for tools mentioned (plain substring scans)
+                has_web_search = b'web_search' in head
+                has_web_fetch = b'web_fetch' in head
+                has_file_ops = b'read_file' in head or b'Read' in head
+
+                # Stream the remainder (if any) just for newline counting
+                # and late tool mentions; a small carry catches substrings
+                # spanning chunk boundaries
+                line_count = head.count(b'\n') + 1
+                carry = head[-16:]
+                while True:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    line_count += chunk.count(b'\n')
+                    window = carry + chunk
+                    has_web_search = has_web_search or b'web_search' in window
+                    has_web_fetch = has_web_fetch or b'web_fetch' in window
+                    has_file_ops = has_file_ops or b'read_file' in window or b'Read' in window
+                    carry = chunk[-16:]
+
+                tools = []
+                if has_web_search:
+                    tools.append('web_search')
+                if has_web_fetch:
+                    tools.append('web_fetch')
+                if has_file_ops:
+                    tools.append('file_operations')
+
+                # Detect agent type
+                agent_type = 'support'
+                if 'coordinator' in agent_name:
+                    agent_type = 'orchestrator'
+                elif 'fetcher' in agent_name or 'media' in agent_name:
+                    agent_type = 'acquisition'
+                elif 'analyzer' in agent_name or 'analysis' in agent_name:
+                    agent_type = 'analysis'
+                elif 'builder' in agent_name or 'knowledge' in agent_name:
+                    agent_type = 'knowledge'
+                elif 'meta' in agent_name:
+                    agent_type = 'meta'
+
+                return agent_name, {
+                    'description': desc_match.group(1).decode('utf-8', 'replace') if desc_match else 'Agent',
+                    'type': agent_type,
+                    'tools': tools,
+                    'file': agent_file,
+                    'lines': line_count
+                }
+        except Exception as e:
+            print(f"Error reading {agent_file}: {e}")
+            return None
+
     def scan_scripts(self) -> List:
         """Scan all Python scripts"""
         scripts_dir = self.base_path / "scripts"
-        script_files = glob.glob(str(scripts_dir / "*.py"))
+        script_files = _list_files(scripts_dir, ".py")
 
-        for script_file in sorted(script_files):
-            script_name = Path(script_file).stem
-            try:
-                with open(script_file, 'r') as f:
-                    content = f.read()
-                    # Extract docstring if present
-                    doc_match = re.search(r'"""(.*?)"""', content, re.DOTALL)
-                    description = doc_match.group(1).strip() if doc_match else ""
-
-                    self.scripts.append({
-                        'name': script_name,
-                        'description': description.split('\n')[0] if description else "",
-                        'file': script_file,
-                        'lines': len(content.split('\n'))
-                    })
-            except Exception as e:
-                print(f"Error reading {script_file}: {e}")
+        self.scripts.extend(self._scan_with_cache(script_files, self._parse_script))
 
         return self.scripts
 
+    @staticmethod
+    def _parse_script(script_file):
+        """Parse one Python script into its summary dict, or None on error"""
+        script_name = Path(script_file).stem
+        try:
+            with open(script_file, 'rb') as f:
+                content = f.read()
+                # Extract docstring if present
+                doc_match = _DOCSTRING_RE.search(content)
+                description = doc_match.group(1).strip() if doc_match else b""
+
+                return {
+                    'name': script_name,
+                    'description': description.split(b'\n')[0].decode('utf-8', 'replace') if description else "",
+                    'file': script_file,
+                    'lines': content.count(b'\n') + 1
+                }
+        except Exception as e:
+            print(f"Error reading {script_file}: {e}")
+            return None
+
     def scan_knowledge_base(self) -> Dict:
         """Scan knowledge base structure and content"""
         kb_path = self.base_path / "learning" / "knowledge"
@@ -108,37 +231,36 @@ class ArchitectureScanner:
                 'relationships': []
             }
 
-            # Scan by-topic
-            topic_dir = kb_path / "by-topic"
-            if topic_dir.exists():
-                for topic in topic_dir.iterdir():
-                    if topic.is_dir():
-                        entries = list(topic.glob("*.md"))
-                        self.knowledge_structure['by-topic'][topic.name] = len(entries)
+            # Scan by-topic in one pass: DirEntry carries cached type info, so
+            # each topic costs one scandir instead of iterdir + glob
+            try:
+                with os.scandir(kb_path / "by-topic") as topics:
+                    for topic in topics:
+                        if topic.is_dir(follow_symlinks=False):
+                            self.knowledge_structure['by-topic'][topic.name] = \
+                                _count_files(topic.path, ".md")
+            except FileNotFoundError:
+                pass
 
             # Scan by-speaker
-            speaker_dir = kb_path / "by-speaker"
-            if speaker_dir.exists():
-                self.knowledge_structure['by-speaker'] = len(list(speaker_dir.glob("*.md")))
+            self.knowledge_structure['by-speaker'] = _count_files(kb_path / "by-speaker", ".md")
 
             # Scan relationships
-            rel_dir = kb_path / "relationships"
-            if rel_dir.exists():
-                self.knowledge_structure['relationships'] = len(list(rel_dir.glob("*.md")))
+            self.knowledge_structure['relationships'] = _count_files(kb_path / "relationships", ".md")
 
         # Also scan for transcripts
-        transcript_dir = self.base_path / "learning" / "raw-transcripts"
-        if transcript_dir.exists():
-            self.knowledge_structure['raw_transcripts'] = len(list(transcript_dir.glob("*.txt")))
+        transcript_count = _count_files(self.base_path / "learning" / "raw-transcripts", ".txt")
+        if transcript_count:
+            self.knowledge_structure['raw_transcripts'] = transcript_count
 
         return self.knowledge_structure
 
     def scan_docs(self) -> List:
         """Scan documentation files"""
         docs_dir = self.base_path / "docs"
-        doc_files = glob.glob(str(docs_dir / "*.md"))
+        doc_files = _list_files(docs_dir, ".md")
 
-        for doc_file in sorted(doc_files):
+        for doc_file in doc_files:
             doc_name = Path(doc_file).stem
             self.docs.append({
                 'name': doc_name,
@@ -149,16 +271,18 @@ class ArchitectureScanner:
 
     def scan_tests(self) -> List:
         """Scan test files"""
-        test_patterns = [
-            "test_*.py",
-            "*_test.py",
-            "tests/*.py"
-        ]
-
-        for pattern in test_patterns:
-            test_files = glob.glob(str(self.base_path / pattern))
-            for test_file in test_files:
-                self.tests.append(Path(test_file).name)
+        try:
+            with os.scandir(self.base_path) as entries:
+                for e in entries:
+                    name = e.name
+                    if name.endswith(".py") and (name.startswith("test_") or
+                                                 name.endswith("_test.py")):
+                        self.tests.append(name)
+        except FileNotFoundError:
+            pass
+
+        for test_file in _list_files(self.base_path / "tests", ".py"):
+            self.tests.append(os.path.basename(test_file))
 
         return self.tests
 
@@ -180,8 +304,19 @@ class ArchitectureScanner:
                 agents_by_type[agent_type] = []
             agents_by_type[agent_type].append((name, info))
 
-        # Build the markdown
-        md = f"""# Claude Agents Workspace - Architecture Overview
+        # Ordering is purely cosmetic, so sort once here at render time
+        # rather than in every scan pass
+        for items in agents_by_type.values():
+            items.sort(key=lambda kv: kv[0])
+        self.scripts.sort(key=lambda s: s['name'])
+        self.docs.sort(key=lambda d: d['name'])
+        self.tests.sort()
+
+        # Build the markdown in a StringIO: it grows its buffer in C by
+        # doubling, so no Python-level list resizing or final join copy
+        out = io.StringIO()
+        w = out.write
+        w(f"""# Claude Agents Workspace - Architecture Overview
 *Auto-generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 
 ## 📊 Current System Statistics
@@ -196,66 +331,66 @@ class ArchitectureScanner:
 ## 🤖 Agent Hierarchy
 
 ### Orchestrator Layer
-"""
+""")
 
         # Add orchestrator agents
         if 'orchestrator' in agents_by_type:
             for name, info in agents_by_type['orchestrator']:
-                md += f"- **`{name}`** - {info['description']}\n"
+                w(f"- **`{name}`** - {info['description']}\n")
                 if info['tools']:
-                    md += f"  - Tools: {', '.join(info['tools'])}\n"
-                md += f"  - Size: {info['lines']} lines\n"
+                    w(f"  - Tools: {', '.join(info['tools'])}\n")
+                w(f"  - Size: {info['lines']} lines\n")
 
-        md += "\n### Content Acquisition Layer\n"
+        w("\n### Content Acquisition Layer\n")
         if 'acquisition' in agents_by_type:
             for name, info in agents_by_type['acquisition']:
-                md += f"- **`{name}`** - {info['description']}\n"
+                w(f"- **`{name}`** - {info['description']}\n")
 
-        md += "\n### Analysis & Processing Layer\n"
+        w("\n### Analysis & Processing Layer\n")
         if 'analysis' in agents_by_type:
             for name, info in agents_by_type['analysis']:
-                md += f"- **`{name}`** - {info['description']}\n"
+                w(f"- **`{name}`** - {info['description']}\n")
 
-        md += "\n### Knowledge Management Layer\n"
+        w("\n### Knowledge Management Layer\n")
         if 'knowledge' in agents_by_type:
             for name, info in agents_by_type['knowledge']:
-                md += f"- **`{name}`** - {info['description']}\n"
+                w(f"- **`{name}`** - {info['description']}\n")
 
-        md += "\n### Meta & Support Layer\n"
+        w("\n### Meta & Support Layer\n")
         if 'meta' in agents_by_type:
             for name, info in agents_by_type['meta']:
-                md += f"- **`{name}`** - {info['description']}\n"
+                w(f"- **`{name}`** - {info['description']}\n")
         if 'support' in agents_by_type:
             for name, info in agents_by_type['support']:
-                md += f"- **`{name}`** - {info['description']}\n"
+                w(f"- **`{name}`** - {info['description']}\n")
 
         # Add scripts section
-        md += "\n## 🔧 Supporting Scripts\n\n"
+        w("\n## 🔧 Supporting Scripts\n\n")
         for script in self.scripts[:10]:  # Show top 10
             if script['description']:
-                md += f"- **`{script['name']}.py`** - {script['description']}\n"
+                w(f"- **`{script['name']}.py`** - {script['description']}\n")
             else:
-                md += f"- **`{script['name']}.py`**\n"
+                w(f"- **`{script['name']}.py`**\n")
 
         if len(self.scripts) > 10:
-            md += f"- *... and {len(self.scripts) - 10} more scripts*\n"
+            w(f"- *... and {len(self.scripts) - 10} more scripts*\n")
 
         # Add knowledge base structure
-        md += "\n## 📚 Knowledge Base Structure\n\n"
-        md += "```\nlearning/knowledge/\n"
+        w("\n## 📚 Knowledge Base Structure\n\n")
+        w("```\nlearning/knowledge/\n")
 
         if self.knowledge_structure.get('by-topic'):
-            md += "├── by-topic/\n"
+            w("├── by-topic/\n")
             for topic, count in self.knowledge_structure['by-topic'].items():
-                md += f"│   ├── {topic}/ ({count} entries)\n"
+                w(f"│   ├── {topic}/ ({count} entries)\n")
 
-        md += f"├── by-speaker/ ({self.knowledge_structure.get('by-speaker', 0)} profiles)\n"
-        md += f"├── timeline/ (chronological organization)\n"
-        md += f"└── relationships/ ({self.knowledge_structure.get('relationships', 0)} connections)\n"
-        md += "```\n"
+        w(f"├── by-speaker/ ({self.knowledge_structure.get('by-speaker', 0)} profiles)\n")
+        w(f"├── timeline/ (chronological organization)\n")
+        w(f"└── relationships/ ({self.knowledge_structure.get('relationships', 0)} connections)\n")
+        w("```\n")
 
         # Add data flow diagram
-        md += """
+        w("""
 ## 🔄 Data Flow Architecture
 
 ```
@@ -279,7 +414,7 @@ USER REQUEST
 
 ## 📁 Directory Structure
 
-"""
+""")
 
         # Add actual directory scan
         dirs_to_show = [
@@ -295,28 +430,27 @@ USER REQUEST
             "output/"
         ]
 
-        md += "```\n"
+        w("```\n")
         for dir_path in dirs_to_show:
             full_path = self.base_path / dir_path
-            if full_path.exists():
+            if full_path.is_dir():
                 # Count files
-                if full_path.is_dir():
-                    file_count = len(list(full_path.glob("*")))
-                    md += f"{dir_path:<30} ({file_count} items)\n"
-        md += "```\n"
+                file_count = _count_files(full_path)
+                w(f"{dir_path:<30} ({file_count} items)\n")
+        w("```\n")
 
         # Add documentation section
-        md += "\n## 📖 Documentation\n\n"
+        w("\n## 📖 Documentation\n\n")
         for doc in self.docs:
-            md += f"- `{doc['name']}.md`\n"
+            w(f"- `{doc['name']}.md`\n")
 
         # Add test section
         if self.tests:
-            md += f"\n## 🧪 Test Coverage\n\n"
+            w(f"\n## 🧪 Test Coverage\n\n")
             for test in self.tests:
-                md += f"- `{test}`\n"
+                w(f"- `{test}`\n")
 
-        md += f"""
+        w(f"""
 ## 🔄 Auto-Update Information
 
 This architecture document is auto-generated by `scripts/architecture_scanner.py`.
@@ -337,28 +471,108 @@ The scanner automatically detects:
 
 **Last Scan**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Scanner Version**: 1.0
-"""
-
-        return md
+""")
+
+        return out.getvalue()
+
+    # Scanner outputs and sidecars that must not feed back into the
+    # workspace fingerprint
+    _FINGERPRINT_SKIP = {
+        "architecture-overview.md",
+        "architecture-overview.md.backup",
+        "architecture-overview.md.tmp",
+        ".arch.hash",
+        CACHE_FILE,
+    }
+
+    def _workspace_fingerprint(self) -> str:
+        """Hash (path, mtime_ns, size) of everything the scanner reads"""
+        h = hashlib.blake2b(digest_size=16)
+        roots = [
+            "agents",
+            "scripts",
+            "docs",
+            "tests",
+            "learning/knowledge",
+            "learning/knowledge/by-topic",
+            "learning/knowledge/by-speaker",
+            "learning/knowledge/relationships",
+            "learning/raw-transcripts",
+            "learning/podcasts",
+            "logs",
+            "output",
+        ]
+        skip = self._FINGERPRINT_SKIP
+        for root in roots:
+            try:
+                entries = sorted(os.scandir(self.base_path / root), key=lambda e: e.name)
+            except FileNotFoundError:
+                continue
+            for e in entries:
+                if e.name in skip:
+                    continue
+                try:
+                    st = e.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                h.update(e.path.encode())
+                h.update(st.st_mtime_ns.to_bytes(8, 'little', signed=True))
+                h.update(st.st_size.to_bytes(8, 'little'))
+
+        # Top-level test files are scanned too
+        try:
+            entries = sorted(os.scandir(self.base_path), key=lambda e: e.name)
+        except FileNotFoundError:
+            entries = []
+        for e in entries:
+            if e.name.endswith(".py") and e.is_file(follow_symlinks=False):
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                h.update(e.path.encode())
+                h.update(st.st_mtime_ns.to_bytes(8, 'little', signed=True))
+                h.update(st.st_size.to_bytes(8, 'little'))
+
+        return h.hexdigest()
 
     def update_architecture_doc(self):
         """Update the architecture documentation file"""
-        architecture_md = self.generate_architecture_md()
-
         doc_path = self.base_path / "docs" / "architecture-overview.md"
+        hash_path = self.base_path / "docs" / ".arch.hash"
+
+        # Short-circuit: if nothing the scanner looks at changed since the
+        # last run, skip regeneration entirely (stat-only pass)
+        fingerprint = self._workspace_fingerprint()
+        try:
+            if doc_path.exists() and hash_path.read_text() == fingerprint:
+                print(f"Architecture documentation unchanged, skipping: {doc_path}")
+                return doc_path
+        except OSError:
+            pass
 
-        # Save backup
+        architecture_md = self.generate_architecture_md()
+
+        # Save backup via rename: an O(1) metadata operation instead of
+        # reading and rewriting the whole document
         if doc_path.exists():
             backup_path = doc_path.with_suffix('.md.backup')
-            with open(doc_path, 'r') as f:
-                backup_content = f.read()
-            with open(backup_path, 'w') as f:
-                f.write(backup_content)
+            os.replace(doc_path, backup_path)
             print(f"Backed up existing architecture to {backup_path}")
 
-        # Write new architecture
-        with open(doc_path, 'w') as f:
-            f.write(architecture_md)
+        # Write new architecture atomically: encode once and write the bytes
+        # in a single call, then rename into place
+        tmp_path = doc_path.with_suffix('.md.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(architecture_md.encode('utf-8'))
+        os.replace(tmp_path, doc_path)
+
+        try:
+            hash_path.write_text(fingerprint)
+        except OSError:
+            pass
+
+        self._save_cache()
 
         print(f"✅ Architecture documentation updated: {doc_path}")
         print(f"   - Found {len(self.agents)} agents")
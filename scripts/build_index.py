@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Knowledge Base Index Builder
+
+Builds an inverted token index over the knowledge entries so that
+`search_knowledge.py --query` only reads files that can actually match
+instead of scanning the whole corpus per query.
+
+Usage:
+    python scripts/build_index.py
+"""
+
+import json
+import re
+from pathlib import Path
+
+# Knowledge base root directory
+KB_ROOT = Path(__file__).parent.parent / "learning" / "knowledge"
+INDEX_FILE = ".index.json"
+
+_TOKEN_RE = re.compile(r'\W+')
+
+
+def _trigrams(text: str) -> set:
+    """Every unique 3-character window of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def build_index(kb_root: Path = KB_ROOT) -> dict:
+    """Walk every entry and map token -> entry paths (relative to kb_root).
+
+    A trigram postings map is built alongside: a file can only contain a
+    query as a substring if it contains every trigram of that query, so
+    the searcher can prune candidates even for mid-word matches that the
+    token index can't see.
+    """
+    by_topic_dir = kb_root / "by-topic"
+    files = {}
+    tokens = {}
+    trigrams = {}
+
+    if by_topic_dir.exists():
+        for topic_dir in by_topic_dir.iterdir():
+            if not topic_dir.is_dir():
+                continue
+
+            for entry_file in topic_dir.glob("*.md"):
+                if entry_file.name == "index.md":
+                    continue
+
+                rel_path = str(entry_file.relative_to(kb_root))
+                files[rel_path] = entry_file.stat().st_mtime_ns
+                text = entry_file.read_text().lower()
+                for token in set(_TOKEN_RE.split(text)):
+                    if token:
+                        tokens.setdefault(token, []).append(rel_path)
+                for tri in _trigrams(text):
+                    trigrams.setdefault(tri, []).append(rel_path)
+
+    return {"files": files, "tokens": tokens, "trigrams": trigrams}
+
+
+def main():
+    index = build_index()
+    index_path = KB_ROOT / INDEX_FILE
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps(index))
+    print(f"Indexed {len(index['files'])} entries "
+          f"({len(index['tokens'])} tokens, "
+          f"{len(index['trigrams'])} trigrams) -> {index_path}")
+
+
+if __name__ == "__main__":
+    main()
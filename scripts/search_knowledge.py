@@ -16,22 +16,153 @@ Usage:
 import os
 import json
 import argparse
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
-from datetime import datetime
 import re
 
+# orjson parses JSON bytes several times faster than the stdlib module;
+# fall back cleanly when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Knowledge base root directory
 KB_ROOT = Path(__file__).parent.parent / "learning" / "knowledge"
 
+# Inverted index produced by scripts/build_index.py
+INDEX_FILE = ".index.json"
+
+# Compiled once at import: these run against every file in the scan loops,
+# where re-parsing the patterns (or missing re's LRU cache) adds up
+_DATE_RE = re.compile(r'(\d{4}-\d{2})-')
+_META_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+_SUMMARY_RE = re.compile(r'## Executive Summary\s*\n(.+?)(?=\n##|\n\*\*|$)', re.DOTALL)
+# Claim markers are fixed strings; matching them against the lowercased
+# bytes cache is a plain memmem scan, no regex machinery needed
+_CLAIM_LITERALS = {
+    t: f'**[{t}]**'.encode()
+    for t in ('prediction', 'data', 'opinion', 'recommendation')
+}
+
 class KnowledgeSearcher:
     """Search and query the temporal knowledge base."""
 
-    def __init__(self, kb_root: Path = KB_ROOT):
+    def __init__(self, kb_root: Path = KB_ROOT, max_workers: int = 8):
         self.kb_root = kb_root
+        self.max_workers = max_workers
         self.by_topic_dir = kb_root / "by-topic"
         self.by_speaker_dir = kb_root / "by-speaker"
         self.timeline_dir = kb_root / "timeline"
+        # Parsed entries memoized by mtime: several queries in one process
+        # re-stat files instead of re-reading and re-running four regexes
+        self._entry_cache: Dict[Path, tuple] = {}
+        # Entry path list shared by every search method, invalidated when
+        # the topic directories' mtimes change
+        self._all_entries: Optional[List[Path]] = None
+        self._entries_stamp = None
+        # Lowercased raw bytes per entry for substring scans, mtime-keyed
+        self._lower_cache: Dict[Path, tuple] = {}
+
+    def _lower_bytes(self, entry_file: Path) -> Optional[bytes]:
+        """Lowercased bytes of an entry, mapped once and cached by mtime."""
+        try:
+            mtime_ns = entry_file.stat().st_mtime_ns
+            cached = self._lower_cache.get(entry_file)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
+            with open(entry_file, 'rb') as f:
+                if os.path.getsize(entry_file):
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        lowered = bytes(mm).lower()
+                else:
+                    lowered = b''  # mmap can't map empty files
+
+            self._lower_cache[entry_file] = (mtime_ns, lowered)
+            return lowered
+        except OSError:
+            return None
+
+    @staticmethod
+    def _scan_md(directory) -> List[Path]:
+        """List .md entries in one directory via scandir (no index.md)."""
+        paths = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if (name.endswith('.md') and name != 'index.md'
+                            and entry.is_file(follow_symlinks=False)):
+                        paths.append(Path(entry.path))
+        except FileNotFoundError:
+            pass
+        return paths
+
+    def _entry_paths(self) -> List[Path]:
+        """List every entry file, walking the tree once per dir generation."""
+        if not self.by_topic_dir.exists():
+            return []
+
+        # One scandir pass gives names, dir flags and mtimes without the
+        # per-Path stat calls iterdir()/is_dir() would re-issue
+        topics = []
+        with os.scandir(self.by_topic_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    topics.append((entry.name, entry.path,
+                                   entry.stat().st_mtime_ns))
+
+        stamp = (self.by_topic_dir.stat().st_mtime_ns,
+                 tuple(sorted((name, mtime) for name, _, mtime in topics)))
+        if self._all_entries is not None and self._entries_stamp == stamp:
+            return self._all_entries
+
+        paths = []
+        for _, topic_path, _ in topics:
+            paths.extend(self._scan_md(topic_path))
+
+        self._all_entries = paths
+        self._entries_stamp = stamp
+        return paths
+
+    def _read_and_parse(self, entry_file: Path):
+        """Read one entry and parse it; None when unreadable or malformed."""
+        try:
+            content = entry_file.read_text()
+        except OSError:
+            return None
+        entry_data = self._parse_entry(entry_file, content)
+        if not entry_data:
+            return None
+        return entry_file, content, entry_data
+
+    def _iter_entries(self):
+        """
+        Yield (path, content, parsed) for every knowledge entry.
+
+        Search methods compose over this single traversal instead of each
+        re-walking by-topic and re-reading every file. Bigger bases are
+        read through a thread pool — the reads release the GIL, so a few
+        threads overlap disk I/O; small ones aren't worth pool startup.
+        """
+        paths = self._entry_paths()
+
+        if len(paths) < 32 or self.max_workers <= 1:
+            for entry_file in paths:
+                item = self._read_and_parse(entry_file)
+                if item:
+                    yield item
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for item in executor.map(self._read_and_parse, paths, chunksize=32):
+                if item:
+                    yield item
 
     def search_by_topic(self, topic: str) -> List[Dict]:
         """Search knowledge entries by topic."""
@@ -40,17 +171,13 @@ class KnowledgeSearcher:
 
         if not topic_dir.exists():
             # Try fuzzy matching
-            available_topics = [d.name for d in self.by_topic_dir.iterdir() if d.is_dir()]
-            matches = [t for t in available_topics if topic.lower() in t.lower()]
+            matches = [t for t in self.list_topics() if topic.lower() in t.lower()]
             if matches:
                 print(f"Topic '{topic}' not found. Did you mean: {', '.join(matches)}?")
             return results
 
         # Read all markdown files in topic directory
-        for entry_file in topic_dir.glob("*.md"):
-            if entry_file.name == "index.md":
-                continue
-
+        for entry_file in self._scan_md(topic_dir):
             entry_data = self._parse_entry(entry_file)
             if entry_data:
                 results.append(entry_data)
@@ -60,23 +187,13 @@ class KnowledgeSearcher:
     def search_by_speaker(self, speaker_name: str) -> List[Dict]:
         """Search knowledge entries by speaker."""
         results = []
+        speaker_lower = speaker_name.lower()
 
         # Search through all topics for speaker mentions
-        for topic_dir in self.by_topic_dir.iterdir():
-            if not topic_dir.is_dir():
-                continue
-
-            for entry_file in topic_dir.glob("*.md"):
-                if entry_file.name == "index.md":
-                    continue
-
-                entry_data = self._parse_entry(entry_file)
-                if entry_data:
-                    metadata = entry_data.get('metadata', {})
-                    speakers = metadata.get('speakers', [])
-
-                    if any(speaker_name.lower() in speaker.lower() for speaker in speakers):
-                        results.append(entry_data)
+        for entry_file, content, entry_data in self._iter_entries():
+            speakers = entry_data.get('metadata', {}).get('speakers', [])
+            if any(speaker_lower in speaker.lower() for speaker in speakers):
+                results.append(entry_data)
 
         return results
 
@@ -84,27 +201,22 @@ class KnowledgeSearcher:
         """Search knowledge entries within date range (YYYY-MM-DD)."""
         results = []
 
-        date_from_obj = datetime.strptime(date_from, "%Y-%m-%d")
-        date_to_obj = datetime.strptime(date_to, "%Y-%m-%d")
-
-        for topic_dir in self.by_topic_dir.iterdir():
-            if not topic_dir.is_dir():
+        # Zero-padded ISO dates compare correctly as strings, so anchoring
+        # each entry's month to its first day keeps the filter a pair of
+        # lexicographic comparisons — no date objects, same predicate
+        for entry_file in self._entry_paths():
+            # The filename carries the date (YYYY-MM-...); filter on it
+            # before paying for a file read and parse
+            date_match = _DATE_RE.match(entry_file.name)
+            if not date_match:
                 continue
 
-            for entry_file in topic_dir.glob("*.md"):
-                if entry_file.name == "index.md":
-                    continue
-
-                entry_data = self._parse_entry(entry_file)
-                if entry_data:
-                    # Extract date from filename (YYYY-MM-...)
-                    date_match = re.match(r'(\d{4}-\d{2})-', entry_file.name)
-                    if date_match:
-                        entry_date_str = date_match.group(1) + "-01"  # Use first of month
-                        entry_date = datetime.strptime(entry_date_str, "%Y-%m-%d")
+            if not (date_from <= date_match.group(1) + "-01" <= date_to):
+                continue
 
-                        if date_from_obj <= entry_date <= date_to_obj:
-                            results.append(entry_data)
+            entry_data = self._parse_entry(entry_file)
+            if entry_data:
+                results.append(entry_data)
 
         return results
 
@@ -112,50 +224,81 @@ class KnowledgeSearcher:
         """Search for entries containing specific claim types (prediction, data, opinion, recommendation)."""
         results = []
 
-        for topic_dir in self.by_topic_dir.iterdir():
-            if not topic_dir.is_dir():
-                continue
-
-            for entry_file in topic_dir.glob("*.md"):
-                if entry_file.name == "index.md":
-                    continue
+        literal = _CLAIM_LITERALS.get(claim_type.lower(),
+                                      f'**[{claim_type.lower()}]**'.encode())
 
-                content = entry_file.read_text()
+        for entry_file in self._entry_paths():
+            lowered = self._lower_bytes(entry_file)
+            if not lowered:
+                continue
 
-                # Check if claim type appears in the content
-                pattern = rf'\*\*\[{claim_type.upper()}\]\*\*'
-                if re.search(pattern, content, re.IGNORECASE):
-                    entry_data = self._parse_entry(entry_file)
-                    if entry_data:
-                        # Count claims of this type
-                        claim_count = len(re.findall(pattern, content, re.IGNORECASE))
-                        entry_data['matching_claims'] = claim_count
-                        results.append(entry_data)
+            # Count claims of this type
+            claim_count = lowered.count(literal)
+            if claim_count:
+                entry_data = self._parse_entry(entry_file)
+                if entry_data:
+                    entry_data['matching_claims'] = claim_count
+                    results.append(entry_data)
 
         return results
 
+    def _load_index(self) -> Optional[Dict]:
+        """Load the inverted index built by scripts/build_index.py, if any."""
+        try:
+            return _loads((self.kb_root / INDEX_FILE).read_bytes())
+        except (OSError, ValueError):
+            return None
+
     def search_by_query(self, query: str) -> List[Dict]:
         """Full-text search across all knowledge entries."""
         results = []
-
-        for topic_dir in self.by_topic_dir.iterdir():
-            if not topic_dir.is_dir():
-                continue
-
-            for entry_file in topic_dir.glob("*.md"):
-                if entry_file.name == "index.md":
-                    continue
-
-                content = entry_file.read_text()
-
-                # Case-insensitive search
-                if query.lower() in content.lower():
-                    entry_data = self._parse_entry(entry_file)
-                    if entry_data:
-                        # Count occurrences
-                        occurrences = content.lower().count(query.lower())
-                        entry_data['occurrences'] = occurrences
-                        results.append(entry_data)
+        query_lower = query.lower()
+
+        # With an index, only files whose postings contain every query
+        # trigram need to be read; files the index hasn't seen (or that
+        # changed since indexing) are still scanned for correctness.
+        # Older tokens-only indexes get no pruning: whole-token postings
+        # can't see mid-word matches, so they'd wrongly drop files for
+        # substring queries. Rebuild the index to regain the fast path.
+        index = self._load_index()
+        indexed_files = index.get('files', {}) if index else {}
+        candidates = None
+        trigrams = index.get('trigrams') if index else None
+        if trigrams is not None and len(query_lower) >= 3:
+            # A file can only contain the query if it contains every
+            # trigram of it — exact for mid-word matches a token index
+            # can't see. Sub-trigram queries fall back to a scan.
+            postings = sorted(
+                (set(trigrams.get(query_lower[i:i + 3], ()))
+                 for i in range(len(query_lower) - 2)),
+                key=len
+            )
+            candidates = postings[0]
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= posting
+
+        query_bytes = query_lower.encode('utf-8')
+
+        for entry_file in self._entry_paths():
+            if candidates is not None:
+                rel_path = str(entry_file.relative_to(self.kb_root))
+                mtime_ns = indexed_files.get(rel_path)
+                if (mtime_ns == entry_file.stat().st_mtime_ns
+                        and rel_path not in candidates):
+                    continue  # index proves the query can't match
+
+            # Case-insensitive search on lowercased bytes: one .lower()
+            # per (file, mtime) and C-level substring matching, instead of
+            # decoding plus two str.lower() copies per query
+            lowered = self._lower_bytes(entry_file)
+            if lowered and query_bytes in lowered:
+                entry_data = self._parse_entry(entry_file)
+                if entry_data:
+                    # Count occurrences
+                    entry_data['occurrences'] = lowered.count(query_bytes)
+                    results.append(entry_data)
 
         return results
 
@@ -170,37 +313,39 @@ class KnowledgeSearcher:
             'extended_by': []
         }
 
+        # One alternation instead of six substring checks per file
+        pattern = re.compile(
+            rf'\*\*(Confirms|Contradicts|Extends)\*\*:\s*\[?{re.escape(entry_id)}')
+        id_bytes = entry_id.encode('utf-8')
+        buckets = {'Confirms': 'confirmed_by',
+                   'Contradicts': 'contradicted_by',
+                   'Extends': 'extended_by'}
+
         # Search all entries for mentions of this entry_id
-        for topic_dir in self.by_topic_dir.iterdir():
-            if not topic_dir.is_dir():
+        for entry_file in self._entry_paths():
+            try:
+                raw = entry_file.read_bytes()
+            except OSError:
                 continue
 
-            for entry_file in topic_dir.glob("*.md"):
-                if entry_file.name == "index.md":
-                    continue
+            # Bytes prefilter: files that never mention the id skip the
+            # UTF-8 decode and the regex entirely
+            if id_bytes not in raw:
+                continue
 
-                content = entry_file.read_text()
-                entry_data = self._parse_entry(entry_file)
+            content = raw.decode('utf-8', 'replace')
+            entry_data = self._parse_entry(entry_file, content)
+            if not entry_data:
+                continue
 
-                if entry_data and entry_data.get('metadata', {}).get('entry_id') == entry_id:
-                    # This is the entry itself - extract its relationships
-                    if '**Confirms**:' in content:
-                        # Parse confirms section
-                        pass  # TODO: Parse markdown sections
-                    if '**Contradicts**:' in content:
-                        pass  # TODO: Parse markdown sections
-                    if '**Extends**:' in content:
-                        pass  # TODO: Parse markdown sections
-                else:
-                    # Check if this entry references our target entry
-                    if entry_id in content:
-                        current_id = entry_data.get('metadata', {}).get('entry_id')
-                        if f'**Confirms**: {entry_id}' in content or f'Confirms**: [{entry_id}]' in content:
-                            relationships['confirmed_by'].append(current_id)
-                        if f'**Contradicts**: {entry_id}' in content or f'Contradicts**: [{entry_id}]' in content:
-                            relationships['contradicted_by'].append(current_id)
-                        if f'**Extends**: {entry_id}' in content or f'Extends**: [{entry_id}]' in content:
-                            relationships['extended_by'].append(current_id)
+            current_id = entry_data.get('metadata', {}).get('entry_id')
+            if current_id == entry_id:
+                # The entry itself - parsing its outgoing relationship
+                # sections is still TODO
+                continue
+
+            for kind in {m.group(1) for m in pattern.finditer(content)}:
+                relationships[buckets[kind]].append(current_id)
 
         return relationships
 
@@ -208,53 +353,82 @@ class KnowledgeSearcher:
         """List all available topics."""
         if not self.by_topic_dir.exists():
             return []
-        return [d.name for d in self.by_topic_dir.iterdir() if d.is_dir()]
+        with os.scandir(self.by_topic_dir) as it:
+            return [entry.name for entry in it
+                    if entry.is_dir(follow_symlinks=False)]
 
     def list_speakers(self) -> List[str]:
         """List all speakers in the knowledge base."""
-        speakers = set()
+        speakers: set = set()
 
-        for topic_dir in self.by_topic_dir.iterdir():
-            if not topic_dir.is_dir():
-                continue
+        for entry_file, content, entry_data in self._iter_entries():
+            # Bulk update is a single C-level call per entry; the () default
+            # avoids allocating a throwaway list when speakers are absent
+            speakers.update(entry_data.get('metadata', {}).get('speakers', ()))
 
-            for entry_file in topic_dir.glob("*.md"):
-                if entry_file.name == "index.md":
-                    continue
+        return sorted(speakers)
 
-                entry_data = self._parse_entry(entry_file)
-                if entry_data:
-                    metadata = entry_data.get('metadata', {})
-                    for speaker in metadata.get('speakers', []):
-                        speakers.add(speaker)
+    def _parse_header_only(self, entry_file: Path) -> Dict:
+        """Extract just the title, reading at most the first 1 KB of the file."""
+        try:
+            with open(entry_file, 'r') as f:
+                head = f.read(1024)
+            title_match = _TITLE_RE.search(head)
+            title = title_match.group(1) if title_match else entry_file.stem
+        except OSError:
+            title = entry_file.stem
+        return {'file_path': str(entry_file), 'title': title}
+
+    def list_entries_by_topic(self, topic: str) -> List[Dict]:
+        """
+        Cheap listing of a topic's entries (path and title only).
 
-        return sorted(list(speakers))
+        Reads at most 1 KB per file; use search_by_topic when summaries
+        and metadata are needed too.
+        """
+        return [self._parse_header_only(entry_file)
+                for entry_file in self._scan_md(self.by_topic_dir / topic)]
 
-    def _parse_entry(self, entry_file: Path) -> Optional[Dict]:
+    def _parse_entry(self, entry_file: Path, content: Optional[str] = None) -> Optional[Dict]:
         """Parse a knowledge entry markdown file and extract metadata."""
         try:
-            content = entry_file.read_text()
-
-            # Extract metadata JSON block
-            metadata_match = re.search(r'```json\s*(\{.*?\})\s*```', content, re.DOTALL)
-            metadata = {}
-            if metadata_match:
-                metadata = json.loads(metadata_match.group(1))
+            mtime_ns = entry_file.stat().st_mtime_ns
+            cached = self._entry_cache.get(entry_file)
+            if cached is not None and cached[0] == mtime_ns:
+                # Shallow copy: callers annotate results (occurrences,
+                # matching_claims) and must not pollute the cached dict
+                return dict(cached[1]) if cached[1] is not None else None
+
+            if content is None:
+                # Full read: the metadata block sits at the end of an
+                # entry, so no head-sized probe can avoid it
+                content = entry_file.read_text()
 
-            # Extract title (first heading)
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+            # Entries lay out title, then Executive Summary, with the
+            # Metadata block last (docs/knowledge-base-workflow.md), so
+            # each search resumes where the previous match ended instead
+            # of rescanning the content from offset zero
+            title_match = _TITLE_RE.search(content)
             title = title_match.group(1) if title_match else entry_file.stem
+            pos = title_match.end() if title_match else 0
+
+            summary_match = _SUMMARY_RE.search(content, pos)
+            summary = ""
+            if summary_match:
+                summary = summary_match.group(1).strip()
+                pos = summary_match.end()
 
-            # Extract executive summary
-            summary_match = re.search(r'## Executive Summary\s*\n(.+?)(?=\n##|\n\*\*|$)', content, re.DOTALL)
-            summary = summary_match.group(1).strip() if summary_match else ""
+            metadata_match = _META_RE.search(content, pos)
+            metadata = _loads(metadata_match.group(1)) if metadata_match else {}
 
-            return {
+            entry_data = {
                 'file_path': str(entry_file),
                 'title': title,
                 'summary': summary,
                 'metadata': metadata
             }
+            self._entry_cache[entry_file] = (mtime_ns, entry_data)
+            return dict(entry_data)
         except Exception as e:
             print(f"Error parsing {entry_file}: {e}")
             return None
@@ -4,20 +4,17 @@ import sys
 import re
 from youtube_transcript_api import YouTubeTranscriptApi
 
+# Compiled once at import; one alternation handles every URL format in a
+# single regex pass instead of trying patterns one by one
+_VID_RE = re.compile(r'(?:v=|embed\/|youtu\.be\/|\/)([0-9A-Za-z_-]{11})')
+
 def extract_video_id(url):
     """Extract video ID from YouTube URL"""
     # Handle different YouTube URL formats
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
+    match = _VID_RE.search(url)
+    if match:
+        return match.group(1)
+
     # Assume it's already a video ID if no pattern matches
     return url
 
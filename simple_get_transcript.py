@@ -4,37 +4,48 @@ Simple YouTube Transcript Fetcher
 Fetches transcripts from YouTube videos using video ID or URL
 """
 
+import asyncio
+import functools
 import sys
 import re
 from youtube_transcript_api import YouTubeTranscriptApi
 
 
+@functools.lru_cache(1)
+def _api():
+    """One shared API instance per process.
+
+    Reusing it keeps the underlying HTTP session alive across fetches, so
+    batch callers get connection keep-alive and TLS reuse instead of a
+    fresh handshake per video.
+    """
+    return YouTubeTranscriptApi()
+
+# Compiled once at import; one alternation covers every URL format we
+# accept, so the regex engine runs a single pass per call
+_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
+_VID_RE = re.compile(
+    r'(?:youtube\.com\/watch\?(?:.*&)?v=|youtu\.be\/|youtube\.com\/embed\/)'
+    r'([a-zA-Z0-9_-]{11})'
+)
+
+
 def extract_video_id(url_or_id):
     """Extract video ID from YouTube URL or return the ID if already provided"""
     # If it's already just an ID (11 characters)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', url_or_id):
+    if len(url_or_id) == 11 and _ID_RE.fullmatch(url_or_id):
         return url_or_id
 
     # Try to extract from various YouTube URL formats
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/watch\?.*&v=([a-zA-Z0-9_-]{11})'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
-        if match:
-            return match.group(1)
-
-    return None
+    match = _VID_RE.search(url_or_id)
+    return match.group(1) if match else None
 
 
 def get_transcript(video_id):
     """Fetch transcript for a YouTube video"""
     try:
-        # Create an instance and fetch transcript
-        api = YouTubeTranscriptApi()
-        transcript = api.fetch(video_id)
+        # Fetch through the shared, session-reusing instance
+        transcript = _api().fetch(video_id)
 
         # Format the transcript
         full_text = []
@@ -48,6 +59,23 @@ def get_transcript(video_id):
         return f"Error fetching transcript: {str(e)}"
 
 
+async def fetch_many(video_ids):
+    """
+    Fetch transcripts for several videos concurrently.
+
+    Each request is network-bound, so overlapping them with asyncio hides
+    most of the per-video latency. Returns transcripts in the same order
+    as video_ids. Callers invoke this via asyncio.run(fetch_many([...])).
+    """
+    semaphore = asyncio.Semaphore(10)
+
+    async def fetch_one(video_id):
+        async with semaphore:
+            return await asyncio.to_thread(get_transcript, video_id)
+
+    return await asyncio.gather(*(fetch_one(v) for v in video_ids))
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python simple_get_transcript.py <YouTube URL or Video ID>")
@@ -5,12 +5,32 @@ Tests transcript fetching and agent functionality
 """
 
 import sys
+import io
 import os
 import json
-import subprocess
+import time
+from collections import Counter
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+import get_transcript
+
+# orjson parses and serializes JSON several times faster than the stdlib
+# module; fall back cleanly when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
 class Colors:
     """Terminal colors for output"""
     GREEN = '\033[92m'
@@ -19,13 +39,23 @@ class Colors:
     BLUE = '\033[94m'
     RESET = '\033[0m'
 
+@dataclass(slots=True)
 class TestResult:
     """Store test results"""
-    def __init__(self, name, status, details=""):
-        self.name = name
-        self.status = status  # "pass", "fail", "skip"
-        self.details = details
-        self.timestamp = datetime.now()
+    name: str
+    status: str  # "pass", "fail", "skip"
+    details: str = ""
+    # Raw clock reading: time_ns is just the syscall, no datetime object;
+    # formatting happens once at report time
+    ts_ns: int = field(default_factory=time.time_ns)
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'status': self.status,
+            'details': self.details,
+            'timestamp': datetime.fromtimestamp(self.ts_ns / 1e9).isoformat()
+        }
 
 class AgentTestSuite:
     """Test suite for agent system"""
@@ -38,21 +68,23 @@ class AgentTestSuite:
             ("invalid_video_id_12345", "Invalid video test"),
         ]
 
-    def run_command(self, cmd):
-        """Run shell command and return result"""
+    def run_fetcher(self, args):
+        """
+        Run get_transcript.main in-process and capture its output.
+
+        Avoids paying interpreter startup and module re-imports for every
+        invocation the way the old shell-out did.
+        """
+        buffer = io.StringIO()
         try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return result.returncode == 0, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "", "Command timed out"
+            with redirect_stdout(buffer), redirect_stderr(buffer):
+                get_transcript.main(args)
+            code = 0
+        except SystemExit as e:
+            code = e.code or 0
         except Exception as e:
-            return False, "", str(e)
+            return False, f"{buffer.getvalue()}\n{e}"
+        return code == 0, buffer.getvalue()
 
     def test_transcript_fetcher(self):
         """Test get_transcript.py functionality"""
@@ -62,7 +94,7 @@ class AgentTestSuite:
         # Test 1: Valid video with captions
         video_url = self.test_videos[0][0]
         print(f"Test 1: Fetching transcript for valid video...")
-        success, stdout, stderr = self.run_command(f"python get_transcript.py {video_url}")
+        success, output = self.run_fetcher([video_url])
 
         if success:
             # Check if files were created
@@ -88,15 +120,15 @@ class AgentTestSuite:
             self.results.append(TestResult(
                 "Transcript Fetcher - Valid Video",
                 "fail",
-                stderr
+                output
             ))
-            print(f"{Colors.RED}✗ Test failed: {stderr}{Colors.RESET}")
+            print(f"{Colors.RED}✗ Test failed: {output}{Colors.RESET}")
 
         # Test 2: Invalid video ID
         print(f"\nTest 2: Testing error handling with invalid video...")
-        success, stdout, stderr = self.run_command(f"python get_transcript.py invalid_id_xyz")
+        success, output = self.run_fetcher(["invalid_id_xyz"])
 
-        if not success and "Error" in stderr:
+        if not success and "Error" in output:
             self.results.append(TestResult(
                 "Transcript Fetcher - Error Handling",
                 "pass",
@@ -120,8 +152,7 @@ class AgentTestSuite:
 
         if os.path.exists(metadata_file):
             try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
+                metadata = _loads(Path(metadata_file).read_bytes())
 
                 required_fields = ['video_info', 'transcript_with_timestamps', 'total_duration']
                 missing_fields = [field for field in required_fields if field not in metadata]
@@ -236,9 +267,19 @@ class AgentTestSuite:
         print(f"{Colors.BLUE}Test Report Summary{Colors.RESET}")
         print(f"{Colors.BLUE}{'='*60}{Colors.RESET}")
 
-        passed = sum(1 for r in self.results if r.status == "pass")
-        failed = sum(1 for r in self.results if r.status == "fail")
-        skipped = sum(1 for r in self.results if r.status == "skip")
+        # Single pass: counts, failure list and serializable dicts together
+        counts = Counter()
+        failed_results = []
+        results_json = []
+        for result in self.results:
+            counts[result.status] += 1
+            if result.status == "fail":
+                failed_results.append(result)
+            results_json.append(result.as_dict())
+
+        passed = counts["pass"]
+        failed = counts["fail"]
+        skipped = counts["skip"]
         total = len(self.results)
 
         print(f"\nTotal Tests: {total}")
@@ -246,11 +287,10 @@ class AgentTestSuite:
         print(f"{Colors.RED}Failed: {failed}{Colors.RESET}")
         print(f"{Colors.YELLOW}Skipped: {skipped}{Colors.RESET}")
 
-        if failed > 0:
+        if failed_results:
             print(f"\n{Colors.RED}Failed Tests:{Colors.RESET}")
-            for result in self.results:
-                if result.status == "fail":
-                    print(f"  - {result.name}: {result.details}")
+            for result in failed_results:
+                print(f"  - {result.name}: {result.details}")
 
         # Save report to file
         report_file = f"test-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
@@ -262,19 +302,10 @@ class AgentTestSuite:
                 "failed": failed,
                 "skipped": skipped
             },
-            "results": [
-                {
-                    "name": r.name,
-                    "status": r.status,
-                    "details": r.details,
-                    "timestamp": r.timestamp.isoformat()
-                }
-                for r in self.results
-            ]
+            "results": results_json
         }
 
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        Path(report_file).write_bytes(_dumps(report_data))
 
         print(f"\n{Colors.BLUE}Report saved to: {report_file}{Colors.RESET}")
 
@@ -7,139 +7,538 @@ Run with: python test_coordinator_logging.py 2>coordinator.log
 Then view logs: cat coordinator.log
 """
 
+import array
+import asyncio
+import atexit
+import collections
+import os
+import queue
 import sys
+import threading
 import time
 import random
-from datetime import datetime, timedelta
+
+# One background thread owns the actual stderr writes: log() only
+# enqueues, so the hot path never takes the stream lock or pays a write
+# syscall per line. The writer drains whole bursts from the queue and
+# hands them to the kernel in one scatter-gather syscall.
+_LOG_QUEUE = queue.SimpleQueue()
+
+
+class CoordEvent:
+    """Pooled carrier for one raw, unformatted event.
+
+    The producer only captures a clock reading, the event type and the
+    kwargs dict; all stringification happens on the writer thread.
+    __slots__ keeps instances at a fixed size with no __dict__, and the
+    free list below recycles them after the writer is done, so
+    steady-state logging allocates nothing per event.
+    """
+
+    __slots__ = ("ts_ns", "evt", "kv", "ring")
+
+
+_POOL = []
+_POOL_MAX = 1024
+_STOP = object()
+
+# os.writev caps the iovec count; stay well under IOV_MAX
+_WRITEV_CHUNK = 512
+
+
+def _emit(ts_ns, evt, kv, ring):
+    event = _POOL.pop() if _POOL else CoordEvent()
+    event.ts_ns = ts_ns
+    event.evt = evt
+    event.kv = kv
+    event.ring = ring
+    _LOG_QUEUE.put(event)
+
+
+def _write_buffers(buffers):
+    """Write pre-encoded line chunks to stderr.
+
+    writev passes the whole list to the kernel in one syscall with no
+    intermediate joined copy; platforms without it fall back to a single
+    buffered join-write.
+    """
+    if hasattr(os, "writev"):
+        fd = sys.stderr.fileno()
+        i = 0
+        while i < len(buffers):
+            written = os.writev(fd, buffers[i:i + _WRITEV_CHUNK])
+            # Skip fully-written chunks; re-slice a partial one
+            while i < len(buffers) and written >= len(buffers[i]):
+                written -= len(buffers[i])
+                i += 1
+            if written and i < len(buffers):
+                buffers[i] = buffers[i][written:]
+    else:
+        sys.stderr.buffer.write(b"".join(buffers))
+        sys.stderr.buffer.flush()
+
+
+def _writer_loop():
+    # The per-millisecond timestamp cache lives here now, with the rest
+    # of the formatting work, so producers only read the clock
+    last_ms = -1
+    last_ts = ""
+    while True:
+        event = _LOG_QUEUE.get()
+        buffers = []
+        stop = False
+        marker = None
+        # Drain the burst so one syscall covers it all
+        while True:
+            if event is _STOP:
+                stop = True
+                break
+            if isinstance(event, threading.Event):
+                # flush() request: write what we have, then signal
+                marker = event
+                break
+            ms = event.ts_ns // 1_000_000
+            if ms != last_ms:
+                last_ms = ms
+                last_ts = _format_iso(event.ts_ns)
+            if _JSON_MODE:
+                line = _json_line({"ts": last_ts, "evt": event.evt, **event.kv})
+            else:
+                line = _format_line(last_ts, event.evt, event.kv)
+            event.ring.append(line)
+            buffers.append(line.encode() + b"\n")
+            event.kv = None
+            event.ring = None
+            if len(_POOL) < _POOL_MAX:
+                _POOL.append(event)
+            try:
+                event = _LOG_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+        if buffers:
+            _write_buffers(buffers)
+        if marker is not None:
+            marker.set()
+        if stop:
+            break
+
+
+_WRITER = threading.Thread(
+    target=_writer_loop, name="coordinator-log-writer", daemon=True)
+_WRITER.start()
+
+
+def _shutdown_logging():
+    _LOG_QUEUE.put(_STOP)
+    _WRITER.join(timeout=2)
+
+
+atexit.register(_shutdown_logging)
+
+# COORDINATOR_LOG_FORMAT=json switches to JSON-lines records: one
+# serializer call per event instead of the kv formatting, still greppable
+# and trivially machine-parseable. orjson serializes small dicts several
+# times faster than the stdlib when it's installed.
+try:
+    import orjson
+
+    def _json_line(record):
+        return orjson.dumps(record).decode()
+except ImportError:
+    import json as _json
+
+    def _json_line(record):
+        return _json.dumps(record, separators=(',', ':'))
+
+_JSON_MODE = os.environ.get("COORDINATOR_LOG_FORMAT") == "json"
+
+
+# Severity per event type; COORDINATOR_LOG_LEVEL suppresses anything
+# below the given threshold before any formatting happens (e.g. 20 drops
+# the chatty STATUS_CHANGE/RESPONSE_RECEIVED/PROMPT_SENT traffic)
+_EVENT_LEVEL = {
+    "ERROR": 40,
+    "FALLBACK": 30,
+    "TASK_START": 20,
+    "TASK_COMPLETE": 20,
+    "DELEGATING": 20,
+    "METRICS": 20,
+    "ANALYSIS": 20,
+    "PLANNING": 20,
+    "STATUS_CHANGE": 10,
+    "RESPONSE_RECEIVED": 10,
+    "PROMPT_SENT": 10,
+    "RESULT_SUMMARY": 10,
+}
+
+# The kwarg vocabulary is small and fixed; precomputing the readable
+# form removes the replace/title string allocations per pair
+_READABLE_KEY = {
+    key: key.replace('_', ' ').title()
+    for key in (
+        'request', 'agent', 'task', 'from_status', 'to', 'status',
+        'output', 'context_length', 'tasks_identified', 'execution_order',
+        'original', 'alternative', 'error', 'total_time', 'agents_used',
+        'tasks_completed', 'errors',
+    )
+}
+
+
+def _format_iso(ns):
+    """ISO-8601 UTC timestamp (ms precision) from a nanosecond reading."""
+    secs, frac_ns = divmod(ns, 1_000_000_000)
+    t = time.gmtime(secs)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (
+        t.tm_year, t.tm_mon, t.tm_mday,
+        t.tm_hour, t.tm_min, t.tm_sec, frac_ns // 1_000_000)
+
+
+# Envelope chunks per event type; the vocabulary is tiny, so each
+# "] COORDINATOR | EVENT" segment is built once and joined in
+_EVT_CACHE = {}
+
+
+def _format_line(timestamp, event_type, kwargs):
+    """Render one event in the text format (writer thread only)."""
+    kv_pairs = [
+        f"{_READABLE_KEY.get(key) or key.replace('_', ' ').title()}: {value}"
+        for key, value in kwargs.items()
+    ]
+    evt = _EVT_CACHE.get(event_type)
+    if evt is None:
+        evt = _EVT_CACHE.setdefault(
+            event_type, "] COORDINATOR | " + event_type)
+    if kv_pairs:
+        return "".join(("[", timestamp, evt, " | ", " | ".join(kv_pairs)))
+    return "".join(("[", timestamp, evt))
+
+
+def _make_err_bits(n=4096, p=0.2):
+    """Bit-pack n pre-sampled Bernoulli(p) outcomes, LSB-first.
+
+    numpy vectorizes the draw and the packing when it's available; the
+    fallback packs the same layout one draw at a time.
+    """
+    try:
+        import numpy as np
+        rng = np.random.default_rng()
+        return bytes(np.packbits((rng.random(n) < p).astype(np.uint8),
+                                 bitorder='little'))
+    except ImportError:
+        bits = bytearray(n // 8)
+        for i in range(n):
+            if random.random() < p:
+                bits[i >> 3] |= 1 << (i & 7)
+        return bytes(bits)
+
+
+class _RealClock:
+    """Wall clock: real sleeps, real readings."""
+
+    sleep = staticmethod(time.sleep)
+    now_ns = staticmethod(time.time_ns)
+    monotonic_ns = staticmethod(time.perf_counter_ns)
+
+    @staticmethod
+    async def async_sleep(seconds):
+        await asyncio.sleep(seconds)
+
+
+class FakeClock:
+    """Deterministic clock: sleeps advance a counter instead of blocking.
+
+    Selected with COORDINATOR_FAKE_CLOCK=1. The whole run becomes
+    CPU-bound and finishes in milliseconds, which turns this script into
+    a logging-throughput microbenchmark.
+    """
+
+    def __init__(self, start_ns=None):
+        self._t_ns = time.time_ns() if start_ns is None else start_ns
+
+    def sleep(self, seconds):
+        self._t_ns += int(seconds * 1e9)
+
+    async def async_sleep(self, seconds):
+        self._t_ns += int(seconds * 1e9)
+        await asyncio.sleep(0)  # still yield to the event loop
+
+    def now_ns(self):
+        return self._t_ns
+
+    # Durations read the same counter, so they stay deterministic too
+    monotonic_ns = now_ns
+
 
 class CoordinatorLogger:
     """Simulates project-coordinator logging behavior"""
 
-    def __init__(self):
-        self.start_time = datetime.utcnow()
-        self.agents_used = 0
-        self.tasks_completed = 0
-        self.errors_encountered = 0
+    def __init__(self, clock=None, rng_batch=None):
+        self.clock = clock or _RealClock()
+        # Optional preallocated unit randoms (e.g. one vectorized numpy
+        # draw for the whole run) consumed round-robin; without a batch
+        # each draw falls back to the Mersenne Twister per call
+        self._rng_batch = rng_batch
+        self._rng_idx = 0
+        # Monotonic ns clock for durations: one vDSO call, and immune to
+        # wall-clock jumps; the wall clock is only read for log timestamps
+        self._t0 = self.clock.monotonic_ns()
+        # Accounting lives in one flat array updated as events pass
+        # through log()/log_batch(), not in increments scattered through
+        # the simulators: [agents delegated, tasks completed, errors]
+        self._counts = array.array('Q', [0, 0, 0])
+        # Flight recorder: the most recent lines stay queryable in memory
+        # at constant cost, no log file needed
+        self._ring = collections.deque(maxlen=4096)
+        # Events below this level cost one dict lookup and an integer
+        # comparison, nothing more
+        self._min_level = int(os.environ.get("COORDINATOR_LOG_LEVEL", "0"))
+        # Pre-sampled error outcomes, bit-packed: consuming a bit replaces
+        # the unpredictable random.random() < 0.2 branch input when the
+        # simulation is looped for throughput runs
+        self._err_bits = _make_err_bits()
+        self._iter = 0
+
+    def reset(self):
+        """Zero the counters and restart the duration clock.
+
+        Reusing one logger across scenarios keeps the writer thread,
+        event pool and caches warm instead of rebuilding them per run.
+        """
+        self._t0 = self.clock.monotonic_ns()
+        self._counts[0] = self._counts[1] = self._counts[2] = 0
+
+    @property
+    def agents_used(self):
+        return self._counts[0]
+
+    @property
+    def tasks_completed(self):
+        return self._counts[1]
+
+    @property
+    def errors_encountered(self):
+        return self._counts[2]
+
+    def _count(self, event_type, kwargs):
+        """Update the aggregate counters from one event."""
+        if event_type == "DELEGATING":
+            self._counts[0] += 1
+        elif event_type == "RESPONSE_RECEIVED":
+            self._counts[1] += 1
+        elif event_type == "ERROR":
+            self._counts[2] += 1
+
+    def _next_rand(self):
+        """Next random float in [0, 1), from the batch when one exists."""
+        batch = self._rng_batch
+        if batch is None:
+            return random.random()
+        i = self._rng_idx
+        self._rng_idx = (i + 1) % len(batch)
+        return batch[i]
+
+    def _uniform(self, low, high):
+        return low + (high - low) * self._next_rand()
 
     def log(self, event_type, **kwargs):
-        """Log an event to stderr with structured format"""
-        timestamp = datetime.utcnow().isoformat() + "Z"
-
-        # Build key-value pairs
-        kv_pairs = []
-        for key, value in kwargs.items():
-            # Convert key from snake_case to readable format
-            readable_key = key.replace('_', ' ').title()
-            kv_pairs.append(f"{readable_key}: {value}")
-
-        # Construct log line
-        if kv_pairs:
-            log_line = f"[{timestamp}] COORDINATOR | {event_type} | {' | '.join(kv_pairs)}"
-        else:
-            log_line = f"[{timestamp}] COORDINATOR | {event_type}"
-
-        # Always log to stderr
-        print(log_line, file=sys.stderr)
-
-    def simulate_youtube_analysis(self, video_url):
-        """Simulate a full YouTube video analysis workflow with logging"""
+        """Log an event to stderr with structured format.
+
+        Only the raw fields are captured here — one clock read, one
+        pooled event, one queue put; the writer thread does all the
+        formatting and I/O off the hot path.
+        """
+        self._count(event_type, kwargs)
+        if _EVENT_LEVEL.get(event_type, 20) < self._min_level:
+            return
+
+        _emit(self.clock.now_ns(), event_type, kwargs, self._ring)
+        if event_type == "TASK_COMPLETE":
+            # Task boundaries drain the queue so anyone tailing (or
+            # dumping the ring) sees the complete run
+            self.flush()
+
+    def log_batch(self, events):
+        """Log a burst of (event_type, kwargs) pairs.
+
+        The burst shares one clock reading, and the writer thread drains
+        it into a single scatter-gather write; each event costs only a
+        pooled capture and a queue put here.
+        """
+        for event_type, kwargs in events:
+            self._count(event_type, kwargs)
+        if self._min_level:
+            events = [(event_type, kwargs) for event_type, kwargs in events
+                      if _EVENT_LEVEL.get(event_type, 20) >= self._min_level]
+            if not events:
+                return
+
+        ts_ns = self.clock.now_ns()
+        needs_flush = False
+        for event_type, kwargs in events:
+            _emit(ts_ns, event_type, kwargs, self._ring)
+            if event_type == "TASK_COMPLETE":
+                needs_flush = True
+        if needs_flush:
+            self.flush()
+
+    def flush(self):
+        """Block until everything enqueued so far has hit stderr."""
+        done = threading.Event()
+        _LOG_QUEUE.put(done)
+        done.wait(timeout=2)
+
+    def dump(self, pattern=None):
+        """Return recent log lines, optionally filtered by substring.
+
+        In-memory flight-recorder view over the last 4096 lines, so the
+        post-mortem queries main() advertises need no log file at all.
+        """
+        if pattern is None:
+            return list(self._ring)
+        return [line for line in self._ring if pattern in line]
+
+    def iter_youtube_analysis(self, video_url):
+        """Yield the analysis workflow as (event_type, kwargs) pairs.
+
+        Pure producer half of the pipeline: no clock reads, no queue,
+        no stderr. Pauses come out as ("_SLEEP", {"s": seconds})
+        markers instead of blocking, so a caller can stream the events
+        into log_batch, a ring buffer or an external sink at whatever
+        cadence suits it. simulate_youtube_analysis is the stock
+        consumer.
+        """
 
         # Task initiation
-        self.log("TASK_START", request="Analyze YouTube video and create knowledge base entry")
-        time.sleep(0.1)  # Simulate processing time
+        yield ("TASK_START", {"request": "Analyze YouTube video and create knowledge base entry"})
+        yield ("_SLEEP", {"s": 0.1})  # Simulate processing time
 
         # Analysis phase
         tasks = ['fetch_transcript', 'analyze_content', 'extract_claims', 'build_knowledge']
-        self.log("ANALYSIS", tasks_identified=str(tasks))
-        self.log("PLANNING", execution_order="sequential (data pipeline)")
-        time.sleep(0.1)
+        yield ("ANALYSIS", {"tasks_identified": str(tasks)})
+        yield ("PLANNING", {"execution_order": "sequential (data pipeline)"})
+        yield ("_SLEEP", {"s": 0.1})
 
         # Task 1: Media Fetcher
-        self.log("DELEGATING", agent="media-fetcher", task="Fetch YouTube transcript")
-        self.log("STATUS_CHANGE", task="fetch_transcript", from_status="PENDING", to="IN_PROGRESS")
+        yield ("DELEGATING", {"agent": "media-fetcher", "task": "Fetch YouTube transcript"})
+        yield ("STATUS_CHANGE", {"task": "fetch_transcript", "from_status": "PENDING", "to": "IN_PROGRESS"})
 
         # Simulate agent work
-        time.sleep(random.uniform(0.5, 1.5))
-        self.agents_used += 1
+        yield ("_SLEEP", {"s": self._uniform(0.5, 1.5)})
 
         # Simulate success
-        self.log("RESPONSE_RECEIVED", agent="media-fetcher", status="SUCCESS")
-        self.log("RESULT_SUMMARY", agent="media-fetcher",
-                output="Transcript saved to learning/raw-transcripts/XuvKFsktX0Q.txt (563 segments)")
-        self.log("STATUS_CHANGE", task="fetch_transcript", from_status="IN_PROGRESS", to="COMPLETED")
-        self.tasks_completed += 1
-        time.sleep(0.1)
+        yield ("RESPONSE_RECEIVED", {"agent": "media-fetcher", "status": "SUCCESS"})
+        yield ("RESULT_SUMMARY", {"agent": "media-fetcher",
+            "output": "Transcript saved to learning/raw-transcripts/XuvKFsktX0Q.txt (563 segments)"})
+        yield ("STATUS_CHANGE", {"task": "fetch_transcript", "from_status": "IN_PROGRESS", "to": "COMPLETED"})
+        yield ("_SLEEP", {"s": 0.1})
 
         # Task 2: Content Analyzer
-        self.log("DELEGATING", agent="content-analyzer", task="Analyze content and extract claims")
-        self.log("PROMPT_SENT", agent="content-analyzer", context_length="12500 tokens")
-        self.log("STATUS_CHANGE", task="analyze_content", from_status="PENDING", to="IN_PROGRESS")
-
-        time.sleep(random.uniform(1.0, 2.0))
-        self.agents_used += 1
-
-        # Simulate random error (20% chance)
-        if random.random() < 0.2:
-            self.log("ERROR", agent="content-analyzer", error="Token limit exceeded")
-            self.log("FALLBACK", original="content-analyzer", alternative="Retry with chunking")
-            self.errors_encountered += 1
-            time.sleep(0.5)
+        yield ("DELEGATING", {"agent": "content-analyzer", "task": "Analyze content and extract claims"})
+        yield ("PROMPT_SENT", {"agent": "content-analyzer", "context_length": "12500 tokens"})
+        yield ("STATUS_CHANGE", {"task": "analyze_content", "from_status": "PENDING", "to": "IN_PROGRESS"})
+
+        yield ("_SLEEP", {"s": self._uniform(1.0, 2.0)})
+
+        # Simulate random error (20% chance, pre-sampled bit lookup)
+        i = self._iter
+        self._iter = i + 1
+        has_error = (self._err_bits[(i >> 3) % len(self._err_bits)] >> (i & 7)) & 1
+        if has_error:
+            yield ("ERROR", {"agent": "content-analyzer", "error": "Token limit exceeded"})
+            yield ("FALLBACK", {"original": "content-analyzer", "alternative": "Retry with chunking"})
+            yield ("_SLEEP", {"s": 0.5})
             # Retry with success
-            self.log("RESPONSE_RECEIVED", agent="content-analyzer", status="SUCCESS (after retry)")
+            yield ("RESPONSE_RECEIVED", {"agent": "content-analyzer", "status": "SUCCESS (after retry)"})
         else:
-            self.log("RESPONSE_RECEIVED", agent="content-analyzer", status="SUCCESS")
+            yield ("RESPONSE_RECEIVED", {"agent": "content-analyzer", "status": "SUCCESS"})
 
-        self.log("RESULT_SUMMARY", agent="content-analyzer",
-                output="15 claims extracted (5 recommendations, 2 predictions, 8 opinions)")
-        self.log("STATUS_CHANGE", task="analyze_content", from_status="IN_PROGRESS", to="COMPLETED")
-        self.tasks_completed += 1
-        time.sleep(0.1)
+        yield ("RESULT_SUMMARY", {"agent": "content-analyzer",
+            "output": "15 claims extracted (5 recommendations, 2 predictions, 8 opinions)"})
+        yield ("STATUS_CHANGE", {"task": "analyze_content", "from_status": "IN_PROGRESS", "to": "COMPLETED"})
+        yield ("_SLEEP", {"s": 0.1})
 
         # Task 3: Knowledge Builder
-        self.log("DELEGATING", agent="knowledge-builder", task="Create knowledge base entry")
-        self.log("STATUS_CHANGE", task="build_knowledge", from_status="PENDING", to="IN_PROGRESS")
+        yield ("DELEGATING", {"agent": "knowledge-builder", "task": "Create knowledge base entry"})
+        yield ("STATUS_CHANGE", {"task": "build_knowledge", "from_status": "PENDING", "to": "IN_PROGRESS"})
 
-        time.sleep(random.uniform(0.8, 1.2))
-        self.agents_used += 1
+        yield ("_SLEEP", {"s": self._uniform(0.8, 1.2)})
 
-        self.log("RESPONSE_RECEIVED", agent="knowledge-builder", status="SUCCESS")
-        self.log("RESULT_SUMMARY", agent="knowledge-builder",
-                output="Entry created: learning/knowledge/by-topic/claude-agents/2025-10-test.md")
-        self.log("STATUS_CHANGE", task="build_knowledge", from_status="IN_PROGRESS", to="COMPLETED")
-        self.tasks_completed += 1
+        yield ("RESPONSE_RECEIVED", {"agent": "knowledge-builder", "status": "SUCCESS"})
+        yield ("RESULT_SUMMARY", {"agent": "knowledge-builder",
+            "output": "Entry created: learning/knowledge/by-topic/claude-agents/2025-10-test.md"})
+        yield ("STATUS_CHANGE", {"task": "build_knowledge", "from_status": "IN_PROGRESS", "to": "COMPLETED"})
+
+    def simulate_youtube_analysis(self, video_url):
+        """Simulate a full YouTube video analysis workflow with logging.
+
+        Consumes iter_youtube_analysis, buffering back-to-back events
+        into a single log_batch per burst and sleeping only at the
+        yielded _SLEEP markers. TASK_COMPLETE/METRICS are appended here
+        rather than yielded: they summarise the logger's own counters,
+        which are only current once the buffered events have been
+        logged.
+        """
+        batch = []
+        for event_type, kwargs in self.iter_youtube_analysis(video_url):
+            if event_type == "_SLEEP":
+                if batch:
+                    self.log_batch(batch)
+                    batch = []
+                self.clock.sleep(kwargs["s"])
+            else:
+                batch.append((event_type, kwargs))
+        if batch:
+            self.log_batch(batch)
 
         # Final metrics
-        end_time = datetime.utcnow()
-        duration = (end_time - self.start_time).total_seconds()
-        self.log("TASK_COMPLETE", total_time=f"{duration:.2f} seconds")
-        self.log("METRICS",
-                agents_used=self.agents_used,
-                tasks_completed=self.tasks_completed,
-                errors=self.errors_encountered)
-
-    def simulate_multi_video_comparison(self, video_urls):
+        duration = (self.clock.monotonic_ns() - self._t0) / 1e9
+        self.log_batch([
+            ("TASK_COMPLETE", {"total_time": f"{duration:.2f} seconds"}),
+            ("METRICS", {"agents_used": self.agents_used,
+                         "tasks_completed": self.tasks_completed,
+                         "errors": self.errors_encountered}),
+        ])
+
+    async def simulate_multi_video_comparison(self, video_urls):
         """Simulate comparing multiple videos with parallel processing"""
 
         self.log("TASK_START", request=f"Compare {len(video_urls)} YouTube videos")
-        time.sleep(0.1)
+        await self.clock.async_sleep(0.1)
 
         # Analysis
         tasks = ['fetch_transcripts_parallel', 'analyze_parallel', 'compare_findings', 'synthesize']
-        self.log("ANALYSIS", tasks_identified=str(tasks))
-        self.log("PLANNING", execution_order="parallel fetch -> parallel analyze -> sequential synthesis")
-        time.sleep(0.1)
-
-        # Parallel fetch simulation
+        self.log_batch([
+            ("ANALYSIS", {"tasks_identified": str(tasks)}),
+            ("PLANNING", {"execution_order": "parallel fetch -> parallel analyze -> sequential synthesis"}),
+        ])
+        await self.clock.async_sleep(0.1)
+
+        # Parallel fetch: real fan-out via gather, so when the delegation
+        # is wired to actual I/O the wall time is the slowest fetch, not
+        # the sum. The semaphore caps in-flight delegations.
         self.log("STATUS_CHANGE", task="fetch_transcripts_parallel", from_status="PENDING", to="IN_PROGRESS")
-        for i, url in enumerate(video_urls, 1):
-            self.log("DELEGATING", agent=f"media-fetcher-{i}", task=f"Fetch transcript {i}")
-            self.agents_used += 1
+        semaphore = asyncio.Semaphore(8)
+
+        # The delegations are semantically simultaneous, so both sides of
+        # the fan-out log as one batch each: 2 writes total instead of
+        # 2 lines per video
+        self.log_batch([
+            ("DELEGATING", {"agent": f"media-fetcher-{i}", "task": f"Fetch transcript {i}"})
+            for i in range(1, len(video_urls) + 1)
+        ])
 
-        time.sleep(random.uniform(1.0, 1.5))  # Simulate parallel work
+        async def _fetch(i, url):
+            async with semaphore:
+                await self.clock.async_sleep(self._uniform(1.0, 1.5))  # Simulate agent work
+                return i
 
-        for i in range(len(video_urls)):
-            self.log("RESPONSE_RECEIVED", agent=f"media-fetcher-{i+1}", status="SUCCESS")
-            self.tasks_completed += 1
+        done = await asyncio.gather(*(_fetch(i, url)
+                                      for i, url in enumerate(video_urls, 1)))
+
+        self.log_batch([
+            ("RESPONSE_RECEIVED", {"agent": f"media-fetcher-{i}", "status": "SUCCESS"})
+            for i in done
+        ])
 
         self.log("STATUS_CHANGE", task="fetch_transcripts_parallel", from_status="IN_PROGRESS", to="COMPLETED")
 
@@ -147,13 +546,13 @@ class CoordinatorLogger:
         # (truncated for brevity)
 
         # Final metrics
-        end_time = datetime.utcnow()
-        duration = (end_time - self.start_time).total_seconds()
-        self.log("TASK_COMPLETE", total_time=f"{duration:.2f} seconds")
-        self.log("METRICS",
-                agents_used=self.agents_used,
-                tasks_completed=self.tasks_completed,
-                errors=self.errors_encountered)
+        duration = (self.clock.monotonic_ns() - self._t0) / 1e9
+        self.log_batch([
+            ("TASK_COMPLETE", {"total_time": f"{duration:.2f} seconds"}),
+            ("METRICS", {"agents_used": self.agents_used,
+                         "tasks_completed": self.tasks_completed,
+                         "errors": self.errors_encountered}),
+        ])
 
 
 def main():
@@ -162,18 +561,30 @@ def main():
     print("Logs are being written to stderr.", file=sys.stdout)
     print("To capture logs: python test_coordinator_logging.py 2>coordinator.log\n", file=sys.stdout)
 
+    # COORDINATOR_FAKE_CLOCK=1 swaps real sleeps for a fast-forward
+    # counter, turning the run into a millisecond-scale microbenchmark
+    clock = FakeClock() if os.environ.get("COORDINATOR_FAKE_CLOCK") == "1" else None
+
+    # One vectorized draw covers every random the simulators consume;
+    # without numpy the loggers fall back to per-call random.random
+    try:
+        import numpy as np
+        rng_batch = np.random.default_rng(42).random(1024).tolist()
+    except ImportError:
+        rng_batch = None
+
     # Create logger instance
-    logger = CoordinatorLogger()
+    logger = CoordinatorLogger(clock=clock, rng_batch=rng_batch)
 
     # Test 1: Single video analysis
     print("Test 1: Single YouTube video analysis...", file=sys.stdout)
     logger.simulate_youtube_analysis("https://youtube.com/watch?v=XuvKFsktX0Q")
 
     print("\nTest 1 complete!", file=sys.stdout)
-    time.sleep(1)
+    logger.clock.sleep(1)
 
-    # Reset for test 2
-    logger = CoordinatorLogger()
+    # Reset for test 2 — same logger, warm pipeline
+    logger.reset()
 
     # Test 2: Multi-video comparison
     print("\nTest 2: Multi-video comparison...", file=sys.stdout)
@@ -182,16 +593,18 @@ def main():
         "https://youtube.com/watch?v=video2",
         "https://youtube.com/watch?v=video3"
     ]
-    logger.simulate_multi_video_comparison(video_urls)
+    asyncio.run(logger.simulate_multi_video_comparison(video_urls))
 
     print("\nTest 2 complete!", file=sys.stdout)
 
     print("\n=== All tests complete ===", file=sys.stdout)
     print("Check the log output to see structured logging in action.", file=sys.stdout)
-    print("\nExample commands to analyze logs:", file=sys.stdout)
-    print("  grep 'DELEGATING' coordinator.log     # See all delegations", file=sys.stdout)
-    print("  grep 'ERROR' coordinator.log          # Find errors", file=sys.stdout)
-    print("  grep 'METRICS' coordinator.log        # See performance metrics", file=sys.stdout)
+    print(f"\nFlight recorder retained {len(logger.dump())} recent events "
+          f"({len(logger.dump('ERROR'))} errors).", file=sys.stdout)
+    print("Query them in-process without a log file:", file=sys.stdout)
+    print("  logger.dump('DELEGATING')   # See all delegations", file=sys.stdout)
+    print("  logger.dump('ERROR')        # Find errors", file=sys.stdout)
+    print("  logger.dump('METRICS')      # See performance metrics", file=sys.stdout)
 
 
 if __name__ == "__main__":